@@ -8,9 +8,53 @@ combines them with appropriate suffixes, sorts by R² values, and saves to 'resu
 Author: Generated for SmartAg Soil Chemistry Prediction Project
 """
 
+import argparse
+import functools
+import heapq
+import itertools
 import json
+import math
 import os
-from collections import OrderedDict
+import re
+
+try:
+    import orjson  # Optional: much faster JSON serialization
+except ImportError:
+    orjson = None
+
+# Suffix appended to method names from the derivatives run
+DERIV_SUFFIX = '_deriv'
+
+# Readable names for common model abbreviations in LaTeX tables
+_LATEX_REPLACEMENTS = {
+    'Enhanced Neural Network': 'Enhanced NN',
+    'Enhanced PLS': 'Enhanced PLS',
+    'Random Forest': 'Random Forest',
+    'MLPRegressor': 'MLP Regressor',
+    'XGBRegressor': 'XGBoost',
+    'LGBMRegressor': 'LightGBM',
+    'ExtraTreesRegressor': 'Extra Trees',
+    'HistGradientBoostingRegressor': 'Hist Gradient Boosting',
+    'GradientBoostingRegressor': 'Gradient Boosting',
+    'KNeighborsRegressor': 'K-Neighbors',
+    'BaggingRegressor': 'Bagging',
+    'AdaBoostRegressor': 'AdaBoost',
+    'LinearRegression': 'Linear Regression',
+    'BayesianRidge': 'Bayesian Ridge',
+    'RidgeCV': 'Ridge CV',
+    'LassoCV': 'Lasso CV',
+    'ElasticNetCV': 'ElasticNet CV',
+    'TransformedTargetRegressor': 'Transformed Target',
+    'OrthogonalMatchingPursuitCV': 'OMP CV',
+    'PCA': 'PCA',
+    'noScale': 'No Scaling',
+    'StndScale': 'Standard Scaling'
+}
+
+# Longest keys first so e.g. 'HistGradientBoostingRegressor' wins over 'GradientBoostingRegressor'
+_LATEX_REPLACEMENTS_RE = re.compile('|'.join(
+    re.escape(key) for key in sorted(_LATEX_REPLACEMENTS, key=len, reverse=True)
+))
 
 def load_json_file(filepath):
     """
@@ -27,8 +71,16 @@ def load_json_file(filepath):
         return {}
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        if orjson is not None:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # orjson rejects NaN/Infinity, which json.dump writes for non-finite R²
+                data = json.loads(raw)
+        else:
+            data = json.loads(raw)
         print(f"SUCCESS: Successfully loaded '{filepath}' with {len(data)} properties")
         return data
     except json.JSONDecodeError as e:
@@ -38,28 +90,6 @@ def load_json_file(filepath):
         print(f"ERROR: Error loading '{filepath}': {e}")
         return {}
 
-def add_suffix_to_methods(data, suffix):
-    """
-    Add suffix to all method names in the data
-    
-    Args:
-        data (dict): Results data with property -> method -> R² structure
-        suffix (str): Suffix to append to method names
-        
-    Returns:
-        dict: Data with suffixed method names
-    """
-    suffixed_data = {}
-    
-    for property_name, methods in data.items():
-        suffixed_data[property_name] = {}
-        
-        for method_name, r2_value in methods.items():
-            new_method_name = f"{method_name}{suffix}"
-            suffixed_data[property_name][new_method_name] = r2_value
-    
-    return suffixed_data
-
 def combine_results(fullrun_data, derivatives_data):
     """
     Combine results from fullrun and derivatives data
@@ -71,24 +101,14 @@ def combine_results(fullrun_data, derivatives_data):
     Returns:
         dict: Combined results with all methods for each property
     """
-    # Add suffix to derivatives data
-    derivatives_suffixed = add_suffix_to_methods(derivatives_data, '_deriv')
+    # Start from a copy of the fullrun methods for each property
+    combined_data = {property_name: dict(methods) for property_name, methods in fullrun_data.items()}
     
-    # Get all unique property names
-    all_properties = set(fullrun_data.keys()) | set(derivatives_suffixed.keys())
-    
-    combined_data = {}
-    
-    for property_name in all_properties:
-        combined_data[property_name] = {}
-        
-        # Add fullrun methods
-        if property_name in fullrun_data:
-            combined_data[property_name].update(fullrun_data[property_name])
-        
-        # Add derivatives methods (with suffix)
-        if property_name in derivatives_suffixed:
-            combined_data[property_name].update(derivatives_suffixed[property_name])
+    # Add derivatives methods, suffixing the names as they are inserted
+    for property_name, methods in derivatives_data.items():
+        property_methods = combined_data.setdefault(property_name, {})
+        for method_name, r2_value in methods.items():
+            property_methods[method_name + DERIV_SUFFIX] = r2_value
     
     return combined_data
 
@@ -105,46 +125,97 @@ def sort_methods_by_r2(data):
     sorted_data = {}
     
     for property_name, methods in data.items():
-        # Filter out None values and sort by R² (descending)
-        valid_methods = {k: v for k, v in methods.items() if v is not None}
-        invalid_methods = {k: v for k, v in methods.items() if v is None}
+        # Split methods into valid and None/NaN results in a single pass
+        # (NaN compares False both ways and would break the sort order)
+        valid_methods = []
+        invalid_methods = []
+        for method_name, r2_value in methods.items():
+            is_valid = r2_value is not None and not math.isnan(r2_value)
+            (valid_methods if is_valid else invalid_methods).append((method_name, r2_value))
         
         # Sort valid methods by R² value (highest first)
-        sorted_valid = dict(sorted(valid_methods.items(), key=lambda item: item[1], reverse=True))
+        valid_methods.sort(key=lambda item: item[1], reverse=True)
         
         # Combine sorted valid methods with invalid methods at the end
-        sorted_methods = OrderedDict()
-        sorted_methods.update(sorted_valid)
-        sorted_methods.update(invalid_methods)
-        
-        sorted_data[property_name] = sorted_methods
-        
-        # Print top 3 methods for this property
-        top_methods = list(sorted_valid.items())[:3]
+        sorted_data[property_name] = dict(valid_methods + invalid_methods)
+    
+    return sorted_data
+
+def report_top_methods(sorted_data, n=3):
+    """
+    Print the top methods for each property
+    
+    Args:
+        sorted_data (dict): Results data with methods sorted by R² (see sort_methods_by_r2)
+        n (int): Number of top methods to print per property
+    """
+    for property_name, methods in sorted_data.items():
+        # None/NaN results are sorted to the end, so the first n entries hold the best valid ones
+        top_methods = [(method, r2) for method, r2 in itertools.islice(methods.items(), n)
+                       if r2 is not None and not math.isnan(r2)]
         if top_methods:
-            print(f"\nTop 3 methods for {property_name}:")
+            print(f"\nTop {n} methods for {property_name}:")
             for i, (method, r2) in enumerate(top_methods, 1):
                 print(f"  {i}. {method}: R² = {r2:.4f}")
         else:
             print(f"\nWARNING: No valid results found for {property_name}")
+
+def get_valid_sorted_methods(sorted_data):
+    """
+    Collect the methods with usable R² values for each property
     
-    return sorted_data
+    Args:
+        sorted_data (dict): Results data with methods sorted by R² (see sort_methods_by_r2)
+        
+    Returns:
+        dict: Property -> list of (method, R²) tuples with valid R² values, highest first
+    """
+    return {
+        property_name: [(method, r2) for method, r2 in methods.items() if r2 is not None and r2 > -1000]
+        for property_name, methods in sorted_data.items()
+    }
+
+def has_non_finite_values(data):
+    """
+    Check whether any R² value is NaN or infinite
+    
+    Args:
+        data (dict): Results data with property -> method -> R² structure
+        
+    Returns:
+        bool: True if at least one R² value is a non-finite float
+    """
+    return any(
+        isinstance(r2_value, float) and not math.isfinite(r2_value)
+        for methods in data.values() for r2_value in methods.values()
+    )
 
-def save_combined_results(data, output_path):
+def save_combined_results(data, output_path, pretty=False):
     """
     Save combined results to JSON file
     
     Args:
         data (dict): Combined and sorted results
         output_path (str): Path to save the combined results
+        pretty (bool): Indent the JSON (4 spaces) for human reading instead of writing it compactly
     """
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        # orjson writes NaN/Infinity as null and can only indent by 2 spaces,
+        # so the stdlib encoder handles pretty output and non-finite values.
+        # Compact output still differs in float notation (e.g. 1e-6 vs 1e-06) with orjson.
+        if orjson is not None and not pretty and not has_non_finite_values(data):
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+        else:
+            # The C-accelerated encoder is only used when no indent is requested
+            json_format = {'indent': 4} if pretty else {'separators': (',', ':')}
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, **json_format)
         print(f"\nSUCCESS: Successfully saved combined results to '{output_path}'")
     except Exception as e:
         print(f"ERROR: Error saving combined results: {e}")
 
+@functools.lru_cache(maxsize=None)
 def clean_method_name_for_latex(method_name):
     """
     Clean method name for LaTeX table display
@@ -159,41 +230,15 @@ def clean_method_name_for_latex(method_name):
     cleaned = method_name
     
     # Remove _deriv suffix but keep track of it
-    is_derivative = cleaned.endswith('_deriv')
+    is_derivative = cleaned.endswith(DERIV_SUFFIX)
     if is_derivative:
-        cleaned = cleaned.replace('_deriv', '')
+        cleaned = cleaned.replace(DERIV_SUFFIX, '')
     
     # Replace underscores with spaces
     cleaned = cleaned.replace('_', ' ')
     
     # Handle common abbreviations and make them more readable
-    replacements = {
-        'Enhanced Neural Network': 'Enhanced NN',
-        'Enhanced PLS': 'Enhanced PLS',
-        'Random Forest': 'Random Forest',
-        'MLPRegressor': 'MLP Regressor',
-        'XGBRegressor': 'XGBoost',
-        'LGBMRegressor': 'LightGBM',
-        'ExtraTreesRegressor': 'Extra Trees',
-        'HistGradientBoostingRegressor': 'Hist Gradient Boosting',
-        'GradientBoostingRegressor': 'Gradient Boosting',
-        'KNeighborsRegressor': 'K-Neighbors',
-        'BaggingRegressor': 'Bagging',
-        'AdaBoostRegressor': 'AdaBoost',
-        'LinearRegression': 'Linear Regression',
-        'BayesianRidge': 'Bayesian Ridge',
-        'RidgeCV': 'Ridge CV',
-        'LassoCV': 'Lasso CV',
-        'ElasticNetCV': 'ElasticNet CV',
-        'TransformedTargetRegressor': 'Transformed Target',
-        'OrthogonalMatchingPursuitCV': 'OMP CV',
-        'PCA': 'PCA',
-        'noScale': 'No Scaling',
-        'StndScale': 'Standard Scaling'
-    }
-    
-    for old, new in replacements.items():
-        cleaned = cleaned.replace(old, new)
+    cleaned = _LATEX_REPLACEMENTS_RE.sub(lambda m: _LATEX_REPLACEMENTS[m.group(0)], cleaned)
     
     # Add derivative indicator
     if is_derivative:
@@ -204,24 +249,28 @@ def clean_method_name_for_latex(method_name):
     
     return cleaned
 
-def create_latex_table(property_name, methods_data, top_n=10):
+def create_latex_table(property_name, methods_data, top_n=10, latex_lines=None):
     """
     Create a LaTeX table for the top methods for a specific property
     
     Args:
         property_name (str): Name of the soil property
-        methods_data (dict): Dictionary of method names and R² values
+        methods_data (list): (method, R²) tuples with valid R² values, highest first
         top_n (int): Number of top methods to include
+        latex_lines (list): Optional list of output lines to append the table to
         
     Returns:
-        str: LaTeX table code
+        list: Lines of LaTeX table code (join with newlines to get the table)
     """
+    if latex_lines is None:
+        latex_lines = []
+    
     # Get top N methods with valid R² values
-    valid_methods = [(method, r2) for method, r2 in methods_data.items() if r2 is not None and r2 > -1000]
-    valid_methods = sorted(valid_methods, key=lambda x: x[1], reverse=True)[:top_n]
+    valid_methods = methods_data[:top_n]
     
     if not valid_methods:
-        return f"% No valid methods found for {property_name}\n\n"
+        latex_lines.extend([f"% No valid methods found for {property_name}", "", ""])
+        return latex_lines
     
     # Clean property name for display
     clean_property = property_name.replace('_', ' ').title()
@@ -230,46 +279,41 @@ def create_latex_table(property_name, methods_data, top_n=10):
     table_label = property_name.lower().replace('_', '')
     
     # Start building the LaTeX table
-    latex_table = []
-    latex_table.append("\\begin{table}[htbp]")
-    latex_table.append("\\centering")
-    latex_table.append(f"\\caption{{Top models for predicting {clean_property}}}")
-    latex_table.append(f"\\label{{tab:{table_label}}}")
-    latex_table.append("\\begin{tabular}{@{}ll@{}}")
-    latex_table.append("\\toprule")
-    latex_table.append("\\textbf{Model} & \\textbf{R\\textsuperscript{2}} \\\\")
-    latex_table.append("\\midrule")
+    latex_lines.append("\\begin{table}[htbp]")
+    latex_lines.append("\\centering")
+    latex_lines.append(f"\\caption{{Top models for predicting {clean_property}}}")
+    latex_lines.append(f"\\label{{tab:{table_label}}}")
+    latex_lines.append("\\begin{tabular}{@{}ll@{}}")
+    latex_lines.append("\\toprule")
+    latex_lines.append("\\textbf{Model} & \\textbf{R\\textsuperscript{2}} \\\\")
+    latex_lines.append("\\midrule")
     
     # Add data rows
-    for method, r2 in valid_methods:
-        clean_method = clean_method_name_for_latex(method)
-        r2_formatted = f"{r2:.3f}"
-        latex_table.append(f"{clean_method} & {r2_formatted} \\\\")
+    latex_lines.extend(f"{clean_method_name_for_latex(method)} & {r2:.3f} \\\\" for method, r2 in valid_methods)
     
     # Close table
-    latex_table.append("\\bottomrule")
-    latex_table.append("\\end{tabular}")
-    latex_table.append("\\end{table}")
-    latex_table.append("")  # Empty line after table
+    latex_lines.append("\\bottomrule")
+    latex_lines.append("\\end{tabular}")
+    latex_lines.append("\\end{table}")
+    latex_lines.append("")  # Empty line after table
     
-    return "\n".join(latex_table)
+    return latex_lines
 
 def generate_all_latex_tables(data, output_file='results_latex_table.txt'):
     """
     Generate LaTeX tables for all properties and save to file
 
     Args:
-        data (dict): Combined results data
+        data (dict): Valid methods per property, highest R² first (see get_valid_sorted_methods)
         output_file (str): Output filename for LaTeX tables
     """
     print(f"\nGenerating LaTeX tables for all soil properties...")
 
     # Sort properties by best R² value for logical ordering
     property_performance = {}
-    for prop, methods in data.items():
-        valid_r2s = [r2 for r2 in methods.values() if r2 is not None and r2 > -1000]
-        if valid_r2s:
-            property_performance[prop] = max(valid_r2s)
+    for prop, valid_methods in data.items():
+        if valid_methods:
+            property_performance[prop] = valid_methods[0][1]
         else:
             property_performance[prop] = -999
 
@@ -285,8 +329,7 @@ def generate_all_latex_tables(data, output_file='results_latex_table.txt'):
     all_tables.append("")
 
     # Generate summary table first
-    summary_table = create_best_methods_summary_table(data)
-    all_tables.append(summary_table)
+    create_best_methods_summary_table(data, all_tables)
     all_tables.append("")
 
     # Add separator comment
@@ -296,8 +339,7 @@ def generate_all_latex_tables(data, output_file='results_latex_table.txt'):
     # Generate detailed tables for each property
     for prop, best_r2 in sorted_properties:
         print(f"  Creating detailed table for {prop} (best R² = {best_r2:.3f})")
-        table_latex = create_latex_table(prop, data[prop], top_n=10)
-        all_tables.append(table_latex)
+        create_latex_table(prop, data[prop], top_n=10, latex_lines=all_tables)
 
     # Save to file
     try:
@@ -313,16 +355,17 @@ def generate_all_latex_tables(data, output_file='results_latex_table.txt'):
     except Exception as e:
         print(f"ERROR: Failed to save LaTeX tables: {e}")
 
-def create_best_methods_summary_table(data):
+def create_best_methods_summary_table(data, latex_lines=None):
     """
     Create a LaTeX summary table showing the best method and R² score for each soil constituent
     Returns exactly 8 rows for the main soil constituents
 
     Args:
-        data (dict): Combined results data
+        data (dict): Valid methods per property, highest R² first (see get_valid_sorted_methods)
+        latex_lines (list): Optional list of output lines to append the table to
 
     Returns:
-        str: LaTeX table code for the summary table
+        list: Lines of LaTeX table code for the summary table
     """
     # Define the 8 main soil constituents we expect
     target_constituents = [
@@ -334,22 +377,23 @@ def create_best_methods_summary_table(data):
     best_methods = []
     for constituent in target_constituents:
         if constituent in data:
-            valid_methods = {k: v for k, v in data[constituent].items() if v is not None and v > -1000}
-            if valid_methods:
-                best_method = max(valid_methods.items(), key=lambda x: x[1])
+            # max() rather than the list head, so the result does not depend on upstream ordering
+            best_method = max(data[constituent], key=lambda x: x[1], default=None)
+            if best_method is not None:
                 best_methods.append((constituent, best_method[0], best_method[1]))
             else:
-                # If no valid methods, use placeholder
-                best_methods.append((constituent, "No valid results", 0.000))
+                # If no valid methods, use placeholder (sorts below any real R²)
+                best_methods.append((constituent, "No valid results", float('-inf')))
         else:
             # If constituent not found in data
-            best_methods.append((constituent, "Not available", 0.000))
+            best_methods.append((constituent, "Not available", float('-inf')))
 
     # Sort by R² score (descending)
     best_methods.sort(key=lambda x: x[2], reverse=True)
 
     # Create LaTeX table
-    latex_lines = []
+    if latex_lines is None:
+        latex_lines = []
     latex_lines.append("% Best Methods Summary Table")
     latex_lines.append("% Shows the top-performing method for each of the 8 main soil constituents")
     latex_lines.append("")
@@ -366,15 +410,12 @@ def create_best_methods_summary_table(data):
     for property_name, method_name, r2_score in best_methods:
         # Clean property name
         clean_property = property_name.replace('_', ' ').title()
-        # Clean method name (handle special cases)
-        if method_name in ["No valid results", "Not available"]:
+        # Placeholder rows have no R² score and a descriptive method name
+        if r2_score == float('-inf'):
             clean_method = method_name
-        else:
-            clean_method = clean_method_name_for_latex(method_name)
-        # Format R² score
-        if r2_score == 0.000 and method_name in ["No valid results", "Not available"]:
             r2_formatted = "—"  # Em dash for missing values
         else:
+            clean_method = clean_method_name_for_latex(method_name)
             r2_formatted = f"{r2_score:.3f}"
 
         latex_lines.append(f"{clean_property} & {clean_method} & {r2_formatted} \\\\")
@@ -384,19 +425,22 @@ def create_best_methods_summary_table(data):
     latex_lines.append("\\end{tabular}")
     latex_lines.append("\\end{table}")
 
-    return "\n".join(latex_lines)
+    return latex_lines
 
 def generate_summary_report(data):
     """
     Generate a summary report of the combined results
 
     Args:
-        data (dict): Combined results data
+        data (dict): Combined results data with methods sorted by R² (see sort_methods_by_r2)
     """
     print(f"\n{'='*80}")
     print("COMBINED RESULTS SUMMARY REPORT")
     print(f"{'='*80}")
     
+    # Slice comparison avoids a method call per name in the loops below
+    deriv_len = len(DERIV_SUFFIX)
+    
     total_methods = 0
     total_properties = len(data)
     fullrun_methods = 0
@@ -405,31 +449,43 @@ def generate_summary_report(data):
     print(f"Total soil properties analyzed: {total_properties}")
     
     for property_name, methods in data.items():
-        valid_methods = [v for v in methods.values() if v is not None]
         n_methods = len(methods)
-        n_valid = len(valid_methods)
+        n_valid = 0
+        prop_derivatives = 0
+        best_method = None
+        best_r2 = worst_r2 = sum_r2 = None
         
-        # Count method types
-        prop_fullrun = sum(1 for method in methods.keys() if not method.endswith('_deriv'))
-        prop_derivatives = sum(1 for method in methods.keys() if method.endswith('_deriv'))
+        # Count method types and collect R² statistics in a single pass
+        for method_name, r2_value in methods.items():
+            if method_name[-deriv_len:] == DERIV_SUFFIX:
+                prop_derivatives += 1
+            if r2_value is None:
+                continue
+            if n_valid == 0:
+                best_method, best_r2, worst_r2, sum_r2 = method_name, r2_value, r2_value, r2_value
+            else:
+                if r2_value > best_r2:
+                    best_method, best_r2 = method_name, r2_value
+                if r2_value < worst_r2:
+                    worst_r2 = r2_value
+                sum_r2 += r2_value
+            n_valid += 1
+        prop_fullrun = n_methods - prop_derivatives
         
         total_methods += n_methods
         fullrun_methods += prop_fullrun
         derivatives_methods += prop_derivatives
         
-        if valid_methods:
-            best_r2 = max(valid_methods)
-            worst_r2 = min(valid_methods)
-            avg_r2 = sum(valid_methods) / len(valid_methods)
+        if n_valid:
+            avg_r2 = sum_r2 / n_valid
             
             print(f"\n{property_name}:")
             print(f"  Methods: {n_methods} total ({prop_fullrun} fullrun, {prop_derivatives} derivatives)")
             print(f"  Valid results: {n_valid}/{n_methods} ({(n_valid/n_methods)*100:.1f}%)")
             print(f"  R² range: {worst_r2:.4f} - {best_r2:.4f} (avg: {avg_r2:.4f})")
             
-            # Find best method
-            best_method = max(methods.items(), key=lambda x: x[1] if x[1] is not None else -1)
-            print(f"  Best method: {best_method[0]} (R² = {best_method[1]:.4f})")
+            # Best method
+            print(f"  Best method: {best_method} (R² = {best_r2:.4f})")
         else:
             print(f"\n{property_name}: No valid results")
     
@@ -441,26 +497,26 @@ def generate_summary_report(data):
     print(f"  Derivatives methods: {derivatives_methods}")
     print(f"Properties with results: {total_properties}")
     
-    # Find overall best performing methods across all properties
-    all_results = []
-    for property_name, methods in data.items():
-        for method_name, r2_value in methods.items():
-            if r2_value is not None:
-                all_results.append((property_name, method_name, r2_value))
+    # Find overall best performing methods across all properties.
+    # Methods are already sorted per property, so merge instead of re-sorting.
+    per_property_results = [
+        [(property_name, method_name, r2_value) for method_name, r2_value in methods.items() if r2_value is not None]
+        for property_name, methods in data.items()
+    ]
+    all_results = list(heapq.merge(*per_property_results, key=lambda x: x[2], reverse=True))
     
     if all_results:
-        # Sort by R² value
-        all_results.sort(key=lambda x: x[2], reverse=True)
-        
         print(f"\nTOP 10 BEST PREDICTIONS OVERALL:")
         print("-" * 60)
         for i, (prop, method, r2) in enumerate(all_results[:10], 1):
-            method_type = "derivatives" if method.endswith('_deriv') else "fullrun"
+            method_type = "derivatives" if method[-deriv_len:] == DERIV_SUFFIX else "fullrun"
             print(f"{i:2d}. {prop:15s} | {method:35s} | R² = {r2:.4f} ({method_type})")
         
         # Compare derivatives vs fullrun performance
-        fullrun_r2s = [r2 for prop, method, r2 in all_results if not method.endswith('_deriv')]
-        deriv_r2s = [r2 for prop, method, r2 in all_results if method.endswith('_deriv')]
+        fullrun_r2s = []
+        deriv_r2s = []
+        for prop, method, r2 in all_results:
+            (deriv_r2s if method[-deriv_len:] == DERIV_SUFFIX else fullrun_r2s).append(r2)
         
         if fullrun_r2s and deriv_r2s:
             avg_fullrun = sum(fullrun_r2s) / len(fullrun_r2s)
@@ -481,6 +537,11 @@ def main():
     """
     Main function to combine and sort results from multiple JSON files
     """
+    parser = argparse.ArgumentParser(description="Combine and sort soil property prediction results")
+    parser.add_argument('--pretty', action='store_true',
+                        help="Write results_combined.json indented by 4 spaces (default: compact)")
+    args = parser.parse_args()
+    
     print("COMBINING SOIL PROPERTY PREDICTION RESULTS")
     print("=" * 60)
     
@@ -517,15 +578,17 @@ def main():
     # Sort methods by R² values
     print("\n3. Sorting methods by R² values...")
     sorted_data = sort_methods_by_r2(combined_data)
+    report_top_methods(sorted_data)
+    valid_sorted_data = get_valid_sorted_methods(sorted_data)
     
     # Save combined results
     print(f"\n4. Saving combined results...")
-    save_combined_results(sorted_data, output_file)
+    save_combined_results(sorted_data, output_file, pretty=args.pretty)
     
     # Generate LaTeX tables (includes summary table)
     print("\n5. Generating LaTeX tables...")
     latex_output = os.path.join(results_dir, 'results_latex_table.txt')
-    generate_all_latex_tables(sorted_data, latex_output)
+    generate_all_latex_tables(valid_sorted_data, latex_output)
 
     # Generate summary report
     print("\n6. Generating summary report...")
@@ -0,0 +1,50 @@
+"""
+Tests for scripts/combine_results.py
+
+Run with: python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import combine_results
+
+
+class TestNaNResults(unittest.TestCase):
+    """NaN R² values (written by json.dump for failed models) must not affect ranking"""
+
+    def setUp(self):
+        self.data = {'Clay_Content': {'a': 0.5, 'b': float('nan'), 'c': 0.9, 'd': 0.7}}
+
+    def test_sort_moves_nan_to_end(self):
+        sorted_data = combine_results.sort_methods_by_r2(self.data)
+        self.assertEqual(list(sorted_data['Clay_Content']), ['c', 'd', 'a', 'b'])
+
+    def test_latex_tables_ignore_nan(self):
+        valid_data = combine_results.get_valid_sorted_methods(combine_results.sort_methods_by_r2(self.data))
+        self.assertEqual(valid_data['Clay_Content'], [('c', 0.9), ('d', 0.7), ('a', 0.5)])
+
+        table = '\n'.join(combine_results.create_latex_table('Clay_Content', valid_data['Clay_Content']))
+        self.assertLess(table.index('C & 0.900'), table.index('D & 0.700'))
+        self.assertLess(table.index('D & 0.700'), table.index('A & 0.500'))
+
+        summary = '\n'.join(combine_results.create_best_methods_summary_table(valid_data))
+        self.assertIn('Clay Content & C & 0.900', summary)
+
+
+class TestSummaryTable(unittest.TestCase):
+    """Placeholder rows must be distinguishable from real (possibly infinite) scores"""
+
+    def test_positive_infinity_is_a_real_score(self):
+        valid_data = {'pH': [('RidgeCV', float('inf'))], 'Sodium': []}
+        summary = '\n'.join(combine_results.create_best_methods_summary_table(valid_data))
+        self.assertIn('Ph & Ridge CV & inf', summary)
+        self.assertIn('Sodium & No valid results & —', summary)
+        self.assertIn('Calcium & Not available & —', summary)
+
+
+if __name__ == '__main__':
+    unittest.main()